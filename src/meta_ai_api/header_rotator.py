@@ -1,14 +1,66 @@
+import os
 import random
-from typing import Dict
+import weakref
+from typing import Dict, Sequence
+
+
+_WINDOWS_PLATFORM = '"Windows"'
+_MACOS_PLATFORM = '"macOS"'
+_LINUX_PLATFORM = '"Linux"'
+
+# User agent markers checked in order; anything unmatched is reported as Linux.
+_PLATFORM_MARKERS = (
+    ("Windows", _WINDOWS_PLATFORM),
+    ("Macintosh", _MACOS_PLATFORM),
+)
+
+
+# Live rotators, tracked weakly so forked children can reseed them.
+_rotators = weakref.WeakSet()
+
+
+def _reseed_rotators() -> None:
+    """
+    Reseed every live HeaderRotator after a fork, so children don't replay the
+    parent's header sequence.
+    """
+    for rotator in list(_rotators):
+        rotator._rng.seed()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_rotators)
+
+
+def _map_ua_platforms(user_agents: Sequence[str]) -> Dict[str, str]:
+    """
+    Map each user agent to the Sec-Ch-Ua-Platform value matching it.
+
+    Args:
+        user_agents (Sequence[str]): The user agents to classify.
+
+    Returns:
+        Dict[str, str]: The platform value for each user agent.
+    """
+    ua_platforms = {}
+    for user_agent in user_agents:
+        ua_platforms[user_agent] = _LINUX_PLATFORM
+        for marker, platform in _PLATFORM_MARKERS:
+            if marker in user_agent:
+                ua_platforms[user_agent] = platform
+                break
+    return ua_platforms
 
 
 class HeaderRotator:
     """
     A class to dynamically rotate HTTP headers to bypass rate limiting and avoid detection.
     Provides randomized user agents, referers, and other headers to prevent rate limiting.
+    Each instance draws from its own random generator, reseeded in forked children,
+    and is safe to share between threads.
     """
 
-    USER_AGENTS = [
+    USER_AGENTS = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
@@ -17,9 +69,15 @@ class HeaderRotator:
         "Mozilla/5.0 (X11; Linux x86_64; rv:132.0) Gecko/20100101 Firefox/132.0",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36 Edg/131.0.0.0",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36 Edg/130.0.0.0",
-    ]
+    )
 
-    ACCEPT_LANGUAGES = [
+    MOBILE_USER_AGENTS = (
+        "Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Mobile Safari/537.36",
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 18_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.1.1 Mobile/15E148 Safari/604.1",
+        "Mozilla/5.0 (Linux; Android 13) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Mobile Safari/537.36",
+    )
+
+    ACCEPT_LANGUAGES = (
         "en-US,en;q=0.9",
         "en-US,en;q=0.9,fr-FR;q=0.8,fr;q=0.7",
         "en-US,en;q=0.9,de-DE;q=0.8,de;q=0.7",
@@ -28,23 +86,58 @@ class HeaderRotator:
         "en-US,en;q=0.9,ja-JP;q=0.8,ja;q=0.7",
         "en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7",
         "en-US,en;q=0.9,pt-BR;q=0.8,pt;q=0.7",
-    ]
+    )
 
-    ACCEPT_ENCODINGS = [
+    ACCEPT_ENCODINGS = (
         "gzip, deflate, br",
         "gzip, deflate",
         "gzip",
-    ]
-
-    SEC_CH_UA_PLATFORMS = [
-        '"Windows"',
-        '"macOS"',
-        '"Linux"',
-    ]
+    )
+
+    SEC_CH_UA_PLATFORMS = (
+        _WINDOWS_PLATFORM,
+        _MACOS_PLATFORM,
+        _LINUX_PLATFORM,
+    )
+
+    _BASE_HEADERS = {
+        "User-Agent": None,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+        "Accept-Language": None,
+        "Accept-Encoding": None,
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Cache-Control": "max-age=0",
+        "Sec-Ch-Ua-Platform": None,
+        "Sec-Ch-Ua-Mobile": "?0",
+        "Pragma": "no-cache",
+    }
+
+    _BASE_MOBILE_HEADERS = {
+        "User-Agent": None,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": None,
+        "Accept-Encoding": "gzip, deflate",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+    }
 
     def __init__(self):
         """Initialize the HeaderRotator."""
         self.rotation_index = 0
+        self._rng = random.Random()
+        _rotators.add(self)
+        # The user agent pool is fixed, so classify each entry once rather than per request.
+        self._ua_platforms = _map_ua_platforms(self.USER_AGENTS)
 
     def get_headers(self) -> Dict[str, str]:
         """
@@ -53,28 +146,14 @@ class HeaderRotator:
         Returns:
             Dict[str, str]: A dictionary of HTTP headers with randomized values.
         """
-        user_agent = random.choice(self.USER_AGENTS)
-        accept_language = random.choice(self.ACCEPT_LANGUAGES)
-        accept_encoding = random.choice(self.ACCEPT_ENCODINGS)
-        sec_ch_ua_platform = random.choice(self.SEC_CH_UA_PLATFORMS)
-
-        headers = {
-            "User-Agent": user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Language": accept_language,
-            "Accept-Encoding": accept_encoding,
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-            "Sec-Ch-Ua-Platform": sec_ch_ua_platform,
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Pragma": "no-cache",
-        }
+        # Static values come from the template; only the rotating fields are set here.
+        # The template carries placeholders for them so the header order is preserved.
+        headers = self._BASE_HEADERS.copy()
+        user_agent = self._rng.choice(self.USER_AGENTS)
+        headers["User-Agent"] = user_agent
+        headers["Accept-Language"] = self._rng.choice(self.ACCEPT_LANGUAGES)
+        headers["Accept-Encoding"] = self._rng.choice(self.ACCEPT_ENCODINGS)
+        headers["Sec-Ch-Ua-Platform"] = self._ua_platforms[user_agent]
 
         return headers
 
@@ -85,26 +164,8 @@ class HeaderRotator:
         Returns:
             Dict[str, str]: A dictionary of mobile HTTP headers.
         """
-        mobile_user_agents = [
-            "Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Mobile Safari/537.36",
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 18_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.1.1 Mobile/15E148 Safari/604.1",
-            "Mozilla/5.0 (Linux; Android 13) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Mobile Safari/537.36",
-        ]
-
-        user_agent = random.choice(mobile_user_agents)
-        accept_language = random.choice(self.ACCEPT_LANGUAGES)
-
-        headers = {
-            "User-Agent": user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": accept_language,
-            "Accept-Encoding": "gzip, deflate",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-        }
+        headers = self._BASE_MOBILE_HEADERS.copy()
+        headers["User-Agent"] = self._rng.choice(self.MOBILE_USER_AGENTS)
+        headers["Accept-Language"] = self._rng.choice(self.ACCEPT_LANGUAGES)
 
         return headers
\ No newline at end of file